@@ -1,15 +1,59 @@
 from dataclasses import dataclass
+from functools import lru_cache
 from os.path import join, dirname, realpath
 
 from eth_utils import to_checksum_address
 
-from bofh.utils.solidity import add_solidity_search_path, get_abi
+from bofh.utils import solidity
+from bofh.utils.solidity import add_solidity_search_path, get_abi as _get_abi
 
 add_solidity_search_path(join(dirname(dirname(dirname(realpath(__file__)))), "contracts"))
 
+_STOP_BIT = 1 << 180  # on Debug contracts, it triggers OPT_BREAK_EARLY
+
+
+@lru_cache(maxsize=64)
+def _load_abi(search_paths, *args, **kwargs):
+    # search_paths only takes part in the cache key: lookups are redone once a search path is added
+    return _get_abi(*args, **kwargs)
+
+
+def get_abi(*args, **kwargs):
+    """memoized bofh.utils.solidity.get_abi(): each artifact is searched and parsed only once.
+    The returned list is shared by all callers and must not be mutated."""
+    return _load_abi(tuple(solidity.SOLIDITY_SEARCH_PATHS), *args, **kwargs)
+
+
+def clear_artifact_cache():
+    """drop memoized ABIs, e.g. after rebuilding artifacts"""
+    _load_abi.cache_clear()
+
+
+def clear_contract_cache():
+    """drop contracts cached by BofhContractIface.get_contract()"""
+    from bofh.contract import _iface  # imported lazily: _iface depends on this module
+    _iface.clear_contract_cache()
+
+
+def _is_mixed_case(addr):
+    """True if the hex digits of a 0x address are neither all-lowercase nor all-uppercase, i.e. EIP-55 encoded"""
+    digits = addr[2:]
+    return digits != digits.lower() and digits != digits.upper()
+
+
+def _fast_checksum(addr):
+    """pass mixed-case (already checksummed) addresses through, checksum everything else"""
+    if isinstance(addr, str) and len(addr) == 42 and addr[:2] == "0x" and _is_mixed_case(addr):
+        return addr
+    return to_checksum_address(addr)
+
+
 @dataclass
 class DebugStatus:
     """debug struct returned by Bofhcontract.multiswap_debug()"""
+    __slots__ = ("token0", "token1", "reserve0", "reserve1", "amountIn", "amountOut", "feePPM",
+                 "amountInWithFee", "tokenOut", "reserveIn", "reserveOut", "numerator", "denominator",
+                 "amount0Out", "amount1Out")
     token0: str
     token1: str
     reserve0: int
@@ -29,6 +73,8 @@ class DebugStatus:
 
 @dataclass
 class SwapInspection:
+    __slots__ = ("tokenIn", "tokenOut", "reserveIn", "reserveOut", "transferredAmountIn", "measuredAmountIn",
+                 "transferredAmountOut", "measuredAmountOut")
     tokenIn: str
     tokenOut: str
     reserveIn: int
@@ -38,54 +84,45 @@ class SwapInspection:
     transferredAmountOut: int
     measuredAmountOut: int
 
+    strict_checksum = False  # set to always recompute EIP-55 checksums of output addresses
+
     @classmethod
     def from_output(cls, data) -> list:
-        res = []
-        if isinstance(data, (list, tuple)):
-            for t in data:
-                assert isinstance(t, (list, tuple))
-                assert len(t) == 8
-                tokenIn = to_checksum_address(t[0])
-                tokenOut = to_checksum_address(t[1])
-                reserveIn = int(t[2])
-                reserveOut = int(t[3])
-                transferredAmountIn = int(t[4])
-                measuredAmountIn = int(t[5])
-                transferredAmountOut = int(t[6])
-                measuredAmountOut = int(t[7])
-                res.append(cls(tokenIn=tokenIn
-                               , tokenOut=tokenOut
-                               , reserveIn=reserveIn
-                               , reserveOut=reserveOut
-                               , transferredAmountIn=transferredAmountIn
-                               , measuredAmountIn=measuredAmountIn
-                               , transferredAmountOut=transferredAmountOut
-                               , measuredAmountOut=measuredAmountOut
-                               ))
-        else:
+        if not isinstance(data, (list, tuple)):
             raise RuntimeError(f"unsupported output format: {type(data)}")
-        return res
+        assert all(isinstance(t, (list, tuple)) and len(t) == 8 for t in data)
+        _tca = to_checksum_address if cls.strict_checksum else _fast_checksum
+        _int = int
+        return [cls(tokenIn=_tca(t[0])
+                    , tokenOut=_tca(t[1])
+                    , reserveIn=_int(t[2])
+                    , reserveOut=_int(t[3])
+                    , transferredAmountIn=_int(t[4])
+                    , measuredAmountIn=_int(t[5])
+                    , transferredAmountOut=_int(t[6])
+                    , measuredAmountOut=_int(t[7])
+                    )
+                for t in data]
 
     @classmethod
     def inspection_calldata(cls, path, initial_amount, override_fees=None):
-        pools = []
-        fees = []
+        n = path.size()
+        swaps = [path.get(i) for i in range(n)]
         if override_fees:
             if isinstance(override_fees, list):
                 pass
             elif isinstance(override_fees, int):
-                override_fees = [override_fees] * path.size()
+                override_fees = [override_fees] * n
             else:
                 raise TypeError("override_fees must be int or list[int]")
-            if len(override_fees) != len(path):
+            if len(override_fees) != n:
                 raise TypeError("override_fees len must match path len")
-        for i in range(path.size()):
-            swap = path.get(i)
-            pools.append(str(swap.pool.address))
-            fee = swap.pool.feesPPM()
-            if override_fees and override_fees[i] is not None:
-                fee = override_fees[i]
-            fees.append(fee)
+        pools = [str(swap.pool.address) for swap in swaps]
+        if override_fees:
+            fees = [swap.pool.feesPPM() if fee is None else fee
+                    for swap, fee in zip(swaps, override_fees)]
+        else:
+            fees = [swap.pool.feesPPM() for swap in swaps]
         return cls.pack_args_payload(pools=pools
                                      , fees=fees
                                      , initial_amount=initial_amount
@@ -98,11 +135,14 @@ class SwapInspection:
                           , expected_amount: int
                           , stop_after_pool=None):
         assert len(pools) == len(fees)
+        _int = int
         args = []
         for i, (addr, fee) in enumerate(zip(pools, fees)):
-            val = int(str(addr), 16) | (fee << 160)
+            if not isinstance(addr, str):
+                addr = str(addr)
+            val = _int(addr, 16) | (fee << 160)
             if stop_after_pool == i:
-                val |= (1 << 180) # set this bit. on Debug contracts, it triggers OPT_BREAK_EARLY
+                val |= _STOP_BIT
             args.append(val)
         amounts_word = \
             ((initial_amount & 0xffffffffffffffffffffffffffffffff) << 0) | \
@@ -0,0 +1,133 @@
+import re
+from collections import OrderedDict
+
+from eth_utils import function_signature_to_4byte_selector, is_checksum_address, to_checksum_address
+from eth_utils.abi import collapse_if_tuple
+
+from bofh.contract import _is_mixed_case, get_abi
+from bofh.utils.web3 import Web3Connector, JSONRPCConnector
+
+_NUM_SPLIT = re.compile(r'[^\d]')
+_ARR_LEN = re.compile(r'\[(\d+)\]')
+_PREFIXES = ("multiswap", "swapinspect")
+_CONTRACT_CACHE = OrderedDict()  # (address, id(abi), rpc_url) --> contract, LRU shared by all BofhContractIface instances
+_CONTRACT_CACHE_MAX = 256
+_CHECKSUM_CACHE = {}  # address as given --> EIP-55 checksummed address
+
+
+def _extract_numeric_tail(text):
+    return _NUM_SPLIT.split(text)[-1]
+
+
+def _parse_numeric_array_length(input_str):
+    m = _ARR_LEN.search(input_str)
+    if m:
+        return int(m.group(1))
+
+
+def _checksum(address):
+    res = _CHECKSUM_CACHE.get(address)
+    if res is None:
+        if isinstance(address, str) and _is_mixed_case(address):
+            # mixed case carries an EIP-55 checksum: reject typos instead of silently fixing them
+            if not is_checksum_address(address):
+                raise ValueError(f"bad EIP-55 checksum for address {address}")
+            res = address
+        else:
+            res = to_checksum_address(address)
+        _CHECKSUM_CACHE[address] = res
+    return res
+
+
+def _signature(entry):
+    return f"{entry['name']}({','.join(collapse_if_tuple(i) for i in entry.get('inputs') or [])})"
+
+
+def method_selectors(abi):
+    """4-byte selectors of all functions in abi, keyed by signature (e.g. "getBaseToken()")"""
+    return {sig: function_signature_to_4byte_selector(sig)
+            for sig in (_signature(c) for c in abi if c.get("type", "function") == "function")}
+
+
+def enumerate_method_selectors(contract):
+    selectors = getattr(contract, "_precomputed_selectors", None) or method_selectors(contract.abi)
+    lines = []
+    for c in contract.abi:
+        fname = c.get("name")
+        if fname and fname.startswith(_PREFIXES):
+            inputs = c.get("inputs") or []
+            calldata = "0x" + selectors[_signature(c)].hex().upper()
+            nn = _extract_numeric_tail(fname)
+            if nn:
+                nn = int(nn)
+                lines.append(f"{calldata}, // {fname}() reads uint256[{nn}] --> PATH_LENGTH={nn-1}")
+            else:
+                assert len(inputs) == 1
+                internalType = inputs[0].get("internalType")
+                assert internalType
+                array_len = _parse_numeric_array_length(internalType)
+                assert isinstance(array_len, int)
+                lines.append(f"{calldata}, // {fname}(uint256[{array_len}]) --> PATH_LENGTH={array_len-1}")
+    if lines:
+        print("\n".join(lines))
+
+
+class BofhContractIface:
+    def __init__(self, get_contract_address=None, get_rpc_url=None):
+        self.__get_contract_address = get_contract_address
+        self.__get_rpc_url = get_rpc_url
+        self.__jsonrpc_conn = None
+        self.__contract = None
+
+    def get_contract(self, address=None, abi=None):
+        if abi is None:
+            abi = get_abi("BofhContract")
+        if address is None and self.__get_contract_address:
+            address = self.__get_contract_address()
+        if address is None:
+            address = "0x" + "0"*40
+        address = _checksum(address)
+        rpc_url = self.__rpc_url()
+        key = (address, id(abi), rpc_url)
+        contract = _CONTRACT_CACHE.get(key)
+        if contract is None:
+            w3 = Web3Connector.get_connection(rpc_url)
+            contract = w3.eth.contract(address=address, abi=abi)
+            # for no-args functions the selector is the whole calldata: web3.eth.call({"to": ..., "data": ...})
+            contract._precomputed_selectors = method_selectors(abi)
+            enumerate_method_selectors(contract)
+            _CONTRACT_CACHE[key] = contract
+            if len(_CONTRACT_CACHE) > _CONTRACT_CACHE_MAX:
+                _CONTRACT_CACHE.popitem(last=False)
+        else:
+            _CONTRACT_CACHE.move_to_end(key)
+        return contract
+
+    @property
+    def contract(self):
+        """get_contract() with default arguments; `del iface.contract` to resolve and build it again"""
+        if self.__contract is None:
+            self.__contract = self.get_contract()
+        return self.__contract
+
+    @contract.deleter
+    def contract(self):
+        if self.__contract is not None:
+            for key in [k for k, v in _CONTRACT_CACHE.items() if v is self.__contract]:
+                del _CONTRACT_CACHE[key]
+            self.__contract = None
+
+    @property
+    def jsonrpc_conn(self):
+        if self.__jsonrpc_conn is None:
+            self.__jsonrpc_conn = JSONRPCConnector.get_connection(self.__rpc_url())
+        return self.__jsonrpc_conn
+
+    def __rpc_url(self):
+        if self.__get_rpc_url:
+            return self.__get_rpc_url()
+
+
+def clear_contract_cache():
+    """drop contracts cached by BofhContractIface.get_contract()"""
+    _CONTRACT_CACHE.clear()